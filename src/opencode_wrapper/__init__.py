@@ -1,6 +1,26 @@
 from __future__ import annotations
 
-from opencode_wrapper.config import OpencodeConfig
-from opencode_wrapper.wrapper import OpencodeRunner
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from opencode_wrapper.config import OpencodeConfig
+    from opencode_wrapper.wrapper import OpencodeRunner
 
 __all__ = ["OpencodeConfig", "OpencodeRunner"]
+
+# Resolved on first access so importing the CLI does not pull in pydantic.
+_EXPORTS = {
+    "OpencodeConfig": "opencode_wrapper.config",
+    "OpencodeRunner": "opencode_wrapper.wrapper",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,23 +1,44 @@
 # src/opencode_wrapper/cli.py
 from __future__ import annotations
 
-import typer
-import yaml
+from typing import Any
 
-from opencode_wrapper.config import ConfigError, ConfigManager
-from opencode_wrapper.wrapper import OpencodeRunner
+import typer
 
 app = typer.Typer(help="Opencode LLM agent wrapper")
 config_app = typer.Typer(help="Manage opencode wrapper configuration")
 app.add_typer(config_app, name="config")
 
 
+def _str_keys(value: Any) -> Any:
+    # Raw YAML allows non-string keys (ints, dates); JSON does not.
+    if isinstance(value, dict):
+        return {str(key): _str_keys(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_str_keys(item) for item in value]
+    return value
+
+
+def _dumps(payload: dict[str, Any]) -> str:
+    # JSON is valid YAML, so the output stays parseable by YAML consumers.
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        return json.dumps(payload, indent=2, default=str)
+    return orjson.dumps(payload, default=str, option=orjson.OPT_INDENT_2).decode()
+
+
 @app.command()
 def run(
     args: list[str] = typer.Argument(None, help="Arguments passed through to opencode"),
-    non_interactive: bool = typer.Option(False, "--non-interactive", help="Capture output instead of streaming"),
+    non_interactive: bool = typer.Option(False, "--non-interactive", help="Pipe output instead of attaching to the terminal"),
 ) -> None:
     """Execute opencode agent with managed configuration."""
+    from opencode_wrapper.config import ConfigError, ConfigManager
+    from opencode_wrapper.wrapper import OpencodeRunner
+
     manager = ConfigManager()
     try:
         load_result = manager.load()
@@ -31,10 +52,6 @@ def run(
     except RuntimeError as exc:
         typer.secho(str(exc), fg=typer.colors.RED)
         raise typer.Exit(code=1) from exc
-    if result.stdout:
-        typer.echo(result.stdout, nl=False)
-    if result.stderr:
-        typer.echo(result.stderr, nl=False, err=True)
     if result.returncode != 0:
         raise typer.Exit(code=result.returncode)
 
@@ -42,6 +59,8 @@ def run(
 @config_app.command("show")
 def config_show() -> None:
     """Show the merged configuration and source locations."""
+    from opencode_wrapper.config import ConfigError, ConfigManager
+
     manager = ConfigManager()
     try:
         load_result = manager.load()
@@ -51,9 +70,17 @@ def config_show() -> None:
 
     payload = {
         "config": load_result.config.model_dump(mode="json"),
-        "sources": [source.model_dump(mode="json") for source in load_result.sources],
+        "sources": [
+            {
+                "path": str(source.path),
+                "exists": source.exists,
+                "loaded": source.loaded,
+                "data": _str_keys(source.data),
+            }
+            for source in load_result.sources
+        ],
     }
-    typer.echo(yaml.safe_dump(payload, sort_keys=False))
+    typer.echo(_dumps(payload))
 
 
 @config_app.command("init")
@@ -61,6 +88,8 @@ def config_init(
     force: bool = typer.Option(False, "--force", help="Overwrite any existing user config"),
 ) -> None:
     """Create a default user configuration file."""
+    from opencode_wrapper.config import ConfigError, ConfigManager
+
     manager = ConfigManager()
     try:
         path = manager.write_default(force=force)
@@ -73,6 +102,8 @@ def config_init(
 @config_app.command("path")
 def config_path() -> None:
     """Show the active configuration paths."""
+    from opencode_wrapper.config import ConfigManager
+
     manager = ConfigManager()
     paths = manager.resolve_paths()
     typer.echo(f"User config: {paths.user_config_file}")
@@ -1,32 +1,65 @@
 from __future__ import annotations
 
+import json
 import os
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
-import yaml
 from pydantic import BaseModel, ConfigDict, Field, field_validator
-from platformdirs import user_config_path
+
+# Parsed YAML keyed by path, invalidated when mtime or size change.
+_YAML_CACHE: dict[Path, tuple[int, int, dict[str, Any]]] = {}
+# Validated configs for files that were the only source, keyed like _YAML_CACHE.
+_CONFIG_CACHE: dict[Path, tuple[int, int, OpencodeConfig]] = {}
+
+
+def _parse_int(value: str) -> int | None:
+    """Parse a positive decimal string, returning None for anything else (signs and zero included)."""
+    digits = value.strip()
+    if not digits.isdecimal():
+        return None
+    number = int(digits)
+    return number if number > 0 else None
+
+
+# Environment overrides as (variable, legacy variable, config field, converter).
+# A converter returning None marks the value as invalid.
+# The misspelled OPENENCODE_* names are still honoured for one release.
+_ENV_KEYS: tuple[tuple[str, str, str, Callable[[str], Any]], ...] = (
+    ("OPENCODE_API_KEY", "OPENENCODE_API_KEY", "api_key", str),
+    ("OPENCODE_MODEL", "OPENENCODE_MODEL", "model", str),
+    ("OPENCODE_MAX_TOKENS", "OPENENCODE_MAX_TOKENS", "max_tokens", _parse_int),
+    ("OPENCODE_WORKSPACE_DIR", "OPENENCODE_WORKSPACE_DIR", "workspace_dir", str),
+)
+
+# Written unexpanded by write_default so config files stay portable across machines.
+_DEFAULT_WORKSPACE_DIR = "~/opencode-workspace"
 
 
 class OpencodeConfig(BaseModel):
     """Configuration for the opencode wrapper."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     api_key: str | None = None
     model: str = Field(default="gpt-4")
     max_tokens: int = Field(default=4096, ge=1, le=32000)
-    workspace_dir: Path = Field(default=Path("~/opencode-workspace"))
+    workspace_dir: Path = Field(default_factory=lambda: Path(_DEFAULT_WORKSPACE_DIR).expanduser())
 
     @field_validator("workspace_dir", mode="before")
     @classmethod
     def expand_workspace_dir(cls, value: Any) -> Path:
-        path = Path(value).expanduser()
-        return path
+        if isinstance(value, Path) and not str(value).startswith("~"):
+            return value
+        if isinstance(value, (str, os.PathLike)):
+            return Path(value).expanduser()
+        raise ValueError("workspace_dir must be a path string")
 
 
-class ConfigPaths(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ConfigPaths:
     """Resolved configuration locations."""
 
     user_config_dir: Path
@@ -34,22 +67,40 @@ class ConfigPaths(BaseModel):
     project_config_file: Path
 
 
-class ConfigSource(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ConfigSource:
     """Information about a configuration source."""
 
     path: Path
     exists: bool
     loaded: bool
-    data: dict[str, Any] = Field(default_factory=dict)
+    data: dict[str, Any] = field(default_factory=dict)
 
 
-class ConfigLoadResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ConfigLoadResult:
     """Loaded configuration with source metadata."""
 
     config: OpencodeConfig
     sources: list[ConfigSource]
 
 
+@lru_cache(maxsize=4)
+def _user_config_root(app_name: str) -> Path:
+    from platformdirs import user_config_path
+
+    return Path(user_config_path(app_name, ensure_exists=False))
+
+
+def _yaml_loader() -> type:
+    """Return the libyaml safe loader when available, else the pure-Python one."""
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:  # pragma: no cover - libyaml not available
+        from yaml import SafeLoader as Loader
+    return Loader
+
+
 class ConfigError(RuntimeError):
     """Raised when configuration cannot be loaded or saved."""
 
@@ -62,8 +113,7 @@ class ConfigManager:
         self.project_file = project_file
 
     def resolve_paths(self, cwd: Path | None = None) -> ConfigPaths:
-        root = user_config_path(self.app_name, ensure_exists=False)
-        user_config_dir = Path(root)
+        user_config_dir = _user_config_root(self.app_name)
         user_config_file = user_config_dir / "config.yaml"
         project_root = cwd or Path.cwd()
         project_config_file = project_root / self.project_file
@@ -77,29 +127,36 @@ class ConfigManager:
         paths = self.resolve_paths(cwd)
         sources = []
 
-        user_data = self._read_yaml(paths.user_config_file)
+        user_exists, user_data = self._read_yaml(paths.user_config_file)
         sources.append(
             ConfigSource(
                 path=paths.user_config_file,
-                exists=paths.user_config_file.exists(),
+                exists=user_exists,
                 loaded=bool(user_data),
                 data=user_data,
             )
         )
 
-        project_data = self._read_yaml(paths.project_config_file)
+        project_exists, project_data = self._read_yaml(paths.project_config_file)
         sources.append(
             ConfigSource(
                 path=paths.project_config_file,
-                exists=paths.project_config_file.exists(),
+                exists=project_exists,
                 loaded=bool(project_data),
                 data=project_data,
             )
         )
 
         env_data = self._read_env()
-        merged = {**user_data, **project_data, **env_data}
-        config = OpencodeConfig.model_validate(merged)
+        if not user_data and not project_data and not env_data:
+            return ConfigLoadResult(config=OpencodeConfig(), sources=sources)
+        # Later layers win: user file, then project file, then environment.
+        if not project_data and not env_data:
+            config = self._validate_cached(paths.user_config_file, user_data)
+        elif not user_data and not env_data:
+            config = OpencodeConfig.model_validate(project_data)
+        else:
+            config = OpencodeConfig.model_validate(user_data | project_data | env_data)
         return ConfigLoadResult(config=config, sources=sources)
 
     def write_default(self, force: bool = False) -> Path:
@@ -108,41 +165,63 @@ class ConfigManager:
             return paths.user_config_file
         paths.user_config_dir.mkdir(parents=True, exist_ok=True)
         default_config = OpencodeConfig().model_dump(mode="json")
+        default_config["workspace_dir"] = _DEFAULT_WORKSPACE_DIR
         self._write_yaml(paths.user_config_file, default_config)
         return paths.user_config_file
 
+    def _validate_cached(self, path: Path, data: dict[str, Any]) -> OpencodeConfig:
+        entry = _YAML_CACHE.get(path)
+        if entry is None:
+            return OpencodeConfig.model_validate(data)
+        mtime_ns, size, _ = entry
+        cached = _CONFIG_CACHE.get(path)
+        if cached is not None and cached[0] == mtime_ns and cached[1] == size:
+            return cached[2]
+        config = OpencodeConfig.model_validate(data)
+        _CONFIG_CACHE[path] = (mtime_ns, size, config)
+        return config
+
     def _read_env(self) -> dict[str, Any]:
         env_map: dict[str, Any] = {}
-        api_key = os.getenv("OPENENCODE_API_KEY")
-        if api_key:
-            env_map["api_key"] = api_key
-        model = os.getenv("OPENENCODE_MODEL")
-        if model:
-            env_map["model"] = model
-        max_tokens = os.getenv("OPENENCODE_MAX_TOKENS")
-        if max_tokens:
-            try:
-                env_map["max_tokens"] = int(max_tokens)
-            except ValueError as exc:
-                raise ConfigError("OPENENCODE_MAX_TOKENS must be an integer") from exc
-        workspace_dir = os.getenv("OPENENCODE_WORKSPACE_DIR")
-        if workspace_dir:
-            env_map["workspace_dir"] = workspace_dir
+        environ = os.environ
+        for key, legacy_key, name, convert in _ENV_KEYS:
+            value = environ.get(key)
+            if not value:
+                key = legacy_key
+                value = environ.get(key)
+            if not value:
+                continue
+            converted = convert(value)
+            if converted is None:
+                raise ConfigError(f"{key} must be a positive integer")
+            env_map[name] = converted
         return env_map
 
-    def _read_yaml(self, path: Path) -> dict[str, Any]:
-        if not path.exists():
-            return {}
+    def _read_yaml(self, path: Path) -> tuple[bool, dict[str, Any]]:
+        try:
+            stat = path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return False, {}
+        cached = _YAML_CACHE.get(path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return True, cached[2].copy()
+        import yaml
+
+        loader = _yaml_loader()
         try:
-            data = yaml.safe_load(path.read_text()) or {}
+            with path.open("rb") as handle:
+                data = yaml.load(handle, Loader=loader) or {}
         except yaml.YAMLError as exc:
             raise ConfigError(f"Invalid YAML in {path}") from exc
         if not isinstance(data, dict):
             raise ConfigError(f"Config file {path} must contain a mapping")
-        return data
+        _YAML_CACHE[path] = (stat.st_mtime_ns, stat.st_size, data)
+        return True, data.copy()
 
     def _write_yaml(self, path: Path, data: dict[str, Any]) -> None:
+        # Flat scalar mapping only: JSON scalars are valid YAML, so the yaml emitter is not needed.
+        text = "".join(f"{key}: {json.dumps(value)}\n" for key, value in data.items())
         try:
-            path.write_text(yaml.safe_dump(data, sort_keys=False))
+            path.write_text(text)
         except OSError as exc:
             raise ConfigError(f"Unable to write config to {path}") from exc
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import codecs
 import os
+import selectors
 import subprocess
+import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Sequence
+from typing import TYPE_CHECKING, Sequence
 
-from pydantic import BaseModel, ConfigDict
+if TYPE_CHECKING:
+    from opencode_wrapper.config import OpencodeConfig
 
-from opencode_wrapper.config import OpencodeConfig
 
-
-class RunResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RunResult:
     """Result of running the opencode command."""
 
     returncode: int
@@ -18,11 +22,10 @@ class RunResult(BaseModel):
     stderr: str | None = None
 
 
-class CommandSpec(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CommandSpec:
     """Command metadata for running opencode."""
 
-    model_config = ConfigDict(frozen=True)
-
     executable: str = "opencode"
 
 
@@ -38,34 +41,82 @@ class OpencodeRunner:
         args: Sequence[str],
         interactive: bool,
         working_dir: Path | None = None,
+        exec_replace: bool = True,
+        capture: bool = False,
     ) -> RunResult:
+        """Run opencode, replacing this process for plain interactive runs.
+
+        With ``interactive`` and ``exec_replace`` set and no ``working_dir``,
+        the wrapper hands the terminal to opencode via ``os.execvpe`` and
+        this method does not return. Non-interactive output is streamed to
+        this process's stdout/stderr as it arrives; pass ``capture`` to also
+        collect it on the returned ``RunResult``.
+        """
         command = [self.command.executable, *args]
         env = self._build_env(config)
         try:
+            if interactive and exec_replace and working_dir is None:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os.execvpe(self.command.executable, command, env)
             if interactive:
                 completed = subprocess.run(command, env=env, cwd=working_dir, check=False)
                 return RunResult(returncode=completed.returncode)
-            completed = subprocess.run(
-                command,
-                env=env,
-                cwd=working_dir,
-                check=False,
-                text=True,
-                capture_output=True,
-            )
+            return self._stream(command, env, working_dir, capture)
         except FileNotFoundError as exc:
             raise RuntimeError("opencode executable not found in PATH") from exc
+
+    def _stream(
+        self,
+        command: list[str],
+        env: dict[str, str],
+        working_dir: Path | None,
+        capture: bool,
+    ) -> RunResult:
+        with subprocess.Popen(
+            command,
+            env=env,
+            cwd=working_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        ) as process, selectors.DefaultSelector() as selector:
+            stdout_chunks: list[str] = []
+            stderr_chunks: list[str] = []
+            for pipe, sink, collected in (
+                (process.stdout, sys.stdout, stdout_chunks),
+                (process.stderr, sys.stderr, stderr_chunks),
+            ):
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                selector.register(pipe, selectors.EVENT_READ, (sink, decoder, collected))
+            while selector.get_map():
+                for key, _ in selector.select():
+                    sink, decoder, collected = key.data
+                    data = os.read(key.fd, 65536)
+                    if not data:
+                        selector.unregister(key.fileobj)
+                    text = decoder.decode(data, final=not data)
+                    if text:
+                        sink.write(text)
+                        sink.flush()
+                        if capture:
+                            collected.append(text)
+            returncode = process.wait()
+        if not capture:
+            return RunResult(returncode=returncode)
         return RunResult(
-            returncode=completed.returncode,
-            stdout=completed.stdout,
-            stderr=completed.stderr,
+            returncode=returncode,
+            stdout="".join(stdout_chunks),
+            stderr="".join(stderr_chunks),
         )
 
     def _build_env(self, config: OpencodeConfig) -> dict[str, str]:
-        env = os.environ.copy()
+        overlay = {
+            "OPENCODE_MODEL": config.model,
+            "OPENCODE_MAX_TOKENS": str(config.max_tokens),
+            "OPENCODE_WORKSPACE_DIR": str(config.workspace_dir),
+        }
         if config.api_key:
-            env["OPENENCODE_API_KEY"] = config.api_key
-        env["OPENENCODE_MODEL"] = config.model
-        env["OPENENCODE_MAX_TOKENS"] = str(config.max_tokens)
-        env["OPENENCODE_WORKSPACE_DIR"] = str(config.workspace_dir)
-        return env
+            overlay["OPENCODE_API_KEY"] = config.api_key
+        # Keep exporting the old misspelled OPENENCODE_* names for one release.
+        legacy = {key.replace("OPENCODE_", "OPENENCODE_", 1): value for key, value in overlay.items()}
+        return {**os.environ, **overlay, **legacy}
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from opencode_wrapper import config
+
+
+@pytest.fixture(autouse=True)
+def isolated_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point HOME/XDG at a temp dir, run from a temp cwd and clear module caches."""
+    home = tmp_path / "home"
+    home.mkdir()
+    project = tmp_path / "project"
+    project.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(home / ".config"))
+    for key, legacy_key, _, _ in config._ENV_KEYS:
+        monkeypatch.delenv(key, raising=False)
+        monkeypatch.delenv(legacy_key, raising=False)
+    monkeypatch.chdir(project)
+    config._user_config_root.cache_clear()
+    config._YAML_CACHE.clear()
+    config._CONFIG_CACHE.clear()
+    return tmp_path
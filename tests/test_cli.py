@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+import opencode_wrapper
+from opencode_wrapper.cli import app
+
+SRC_DIR = Path(opencode_wrapper.__file__).resolve().parent.parent
+
+
+def _modules_loaded_after(args: list[str], modules: list[str]) -> dict[str, bool]:
+    code = (
+        "import json, sys\n"
+        "from opencode_wrapper.cli import app\n"
+        "try:\n"
+        f"    app({args!r})\n"
+        "except SystemExit as exc:\n"
+        "    assert not exc.code, exc.code\n"
+        f"print(json.dumps({{name: name in sys.modules for name in {modules!r}}}))\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    completed = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.splitlines()[-1])
+
+
+def test_config_path_does_not_import_yaml(isolated_env: Path) -> None:
+    assert _modules_loaded_after(["config", "path"], ["yaml"]) == {"yaml": False}
+
+
+def test_help_does_not_import_config_stack(isolated_env: Path) -> None:
+    modules = ["yaml", "pydantic", "opencode_wrapper.config", "opencode_wrapper.wrapper"]
+
+    assert _modules_loaded_after(["--help"], modules) == dict.fromkeys(modules, False)
+
+
+def test_package_exports_resolve_lazily() -> None:
+    from opencode_wrapper.config import OpencodeConfig
+    from opencode_wrapper.wrapper import OpencodeRunner
+
+    assert opencode_wrapper.OpencodeConfig is OpencodeConfig
+    assert opencode_wrapper.OpencodeRunner is OpencodeRunner
+
+
+@pytest.mark.parametrize("backend", ["orjson", "json"])
+def test_config_show_handles_non_json_yaml(isolated_env: Path, monkeypatch: pytest.MonkeyPatch, backend: str) -> None:
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    (isolated_env / "project" / ".opencode.yaml").write_text(
+        "1: bar\n2024-01-01: x\nblob: !!binary aGVsbG8=\nnested:\n  - {3: y}\n"
+    )
+
+    result = CliRunner().invoke(app, ["config", "show"])
+
+    assert result.exit_code == 0, result.output
+    data = json.loads(result.output)["sources"][1]["data"]
+    assert data == {"1": "bar", "2024-01-01": "x", "blob": "b'hello'", "nested": [{"3": "y"}]}
+
+
+def test_config_subcommands_are_registered() -> None:
+    config_group = typer.main.get_command(app).commands["config"]
+
+    assert set(config_group.commands) == {"show", "init", "path"}
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+from pydantic import ValidationError
+
+from opencode_wrapper.config import ConfigError, ConfigManager, OpencodeConfig
+
+
+@pytest.fixture
+def user_config(isolated_env: Path) -> Path:
+    path = ConfigManager().resolve_paths().user_config_file
+    path.parent.mkdir(parents=True)
+    return path
+
+
+@pytest.fixture
+def yaml_loads(monkeypatch: pytest.MonkeyPatch) -> list[object]:
+    calls: list[object] = []
+    real_load = yaml.load
+
+    def counting_load(stream: object, Loader: type) -> object:
+        calls.append(stream)
+        return real_load(stream, Loader=Loader)
+
+    monkeypatch.setattr(yaml, "load", counting_load)
+    return calls
+
+
+def test_read_yaml_reuses_parse_until_file_changes(user_config: Path, yaml_loads: list[object]) -> None:
+    user_config.write_text("model: first\n")
+    manager = ConfigManager()
+
+    assert manager.load().config.model == "first"
+    assert manager.load().config.model == "first"
+    assert len(yaml_loads) == 1
+
+    user_config.write_text("model: second-model\n")
+    assert manager.load().config.model == "second-model"
+    assert len(yaml_loads) == 2
+
+
+def test_read_yaml_invalidates_on_mtime_change(user_config: Path, yaml_loads: list[object]) -> None:
+    user_config.write_text("model: aaaa\n")
+    manager = ConfigManager()
+    assert manager.load().config.model == "aaaa"
+
+    stat = user_config.stat()
+    user_config.write_text("model: bbbb\n")
+    os.utime(user_config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert manager.load().config.model == "bbbb"
+    assert len(yaml_loads) == 2
+
+
+def test_read_yaml_returns_copy_of_cached_data(user_config: Path) -> None:
+    user_config.write_text("model: first\n")
+    manager = ConfigManager()
+
+    exists, data = manager._read_yaml(user_config)
+    assert exists
+    data["model"] = "mutated"
+    assert manager._read_yaml(user_config) == (True, {"model": "first"})
+
+
+def test_env_override_reads_opencode_names(isolated_env: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OPENCODE_MODEL", "env-model")
+    monkeypatch.setenv("OPENCODE_MAX_TOKENS", "123")
+
+    config = ConfigManager().load().config
+
+    assert config.model == "env-model"
+    assert config.max_tokens == 123
+
+
+def test_env_override_falls_back_to_legacy_names(isolated_env: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OPENENCODE_MODEL", "legacy-model")
+
+    assert ConfigManager().load().config.model == "legacy-model"
+
+
+def test_env_override_prefers_new_name_over_legacy(isolated_env: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OPENCODE_MODEL", "new-model")
+    monkeypatch.setenv("OPENENCODE_MODEL", "legacy-model")
+
+    assert ConfigManager().load().config.model == "new-model"
+
+
+def test_env_override_beats_config_files(user_config: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    user_config.write_text("model: file-model\nmax_tokens: 10\n")
+    monkeypatch.setenv("OPENCODE_MODEL", "env-model")
+
+    config = ConfigManager().load().config
+
+    assert config.model == "env-model"
+    assert config.max_tokens == 10
+
+
+def test_user_only_config_reuses_validated_instance(user_config: Path) -> None:
+    user_config.write_text("model: first\n")
+    manager = ConfigManager()
+
+    first = manager.load().config
+    assert manager.load().config is first
+
+    user_config.write_text("model: second-model\n")
+    second = manager.load().config
+    assert second is not first
+    assert second.model == "second-model"
+
+
+def test_project_layer_bypasses_validated_cache(user_config: Path, isolated_env: Path) -> None:
+    user_config.write_text("model: user\nmax_tokens: 10\n")
+    manager = ConfigManager()
+    cached = manager.load().config
+
+    (isolated_env / "project" / ".opencode.yaml").write_text("model: project\n")
+    config = manager.load().config
+
+    assert config is not cached
+    assert (config.model, config.max_tokens) == ("project", 10)
+
+
+def test_shared_config_is_frozen(user_config: Path) -> None:
+    user_config.write_text("model: first\n")
+    config = ConfigManager().load().config
+
+    with pytest.raises(ValidationError):
+        config.model = "changed"
+
+
+def test_load_treats_file_as_cwd_as_missing_project_config(isolated_env: Path) -> None:
+    not_a_dir = isolated_env / "plain-file"
+    not_a_dir.write_text("")
+
+    result = ConfigManager().load(cwd=not_a_dir)
+
+    project_source = result.sources[1]
+    assert (project_source.exists, project_source.loaded) == (False, False)
+
+
+def test_write_default_keeps_workspace_dir_portable(isolated_env: Path) -> None:
+    manager = ConfigManager()
+
+    path = manager.write_default()
+
+    assert 'workspace_dir: "~/opencode-workspace"' in path.read_text().splitlines()
+    assert manager.load().config.workspace_dir == isolated_env / "home" / "opencode-workspace"
+
+
+def test_env_max_tokens_accepts_padded_digits(isolated_env: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OPENCODE_MAX_TOKENS", " 12 ")
+
+    assert ConfigManager().load().config.max_tokens == 12
+
+
+@pytest.mark.parametrize("value", ["0", "-5", "abc", "1.5", "²"])
+def test_env_max_tokens_rejects_non_positive_integers(
+    isolated_env: Path, monkeypatch: pytest.MonkeyPatch, value: str
+) -> None:
+    monkeypatch.setenv("OPENCODE_MAX_TOKENS", value)
+
+    with pytest.raises(ConfigError, match="OPENCODE_MAX_TOKENS must be a positive integer"):
+        ConfigManager().load()
+
+
+@pytest.mark.parametrize("value", ["~", "123", "[a]"])
+def test_workspace_dir_rejects_non_path_yaml(isolated_env: Path, value: str) -> None:
+    (isolated_env / "project" / ".opencode.yaml").write_text(f"workspace_dir: {value}\n")
+
+    with pytest.raises(ValidationError, match="workspace_dir"):
+        ConfigManager().load()
+
+
+def test_workspace_dir_expands_user_paths(isolated_env: Path) -> None:
+    home = isolated_env / "home"
+
+    assert OpencodeConfig(workspace_dir="~/ws").workspace_dir == home / "ws"
+    assert OpencodeConfig(workspace_dir=Path("~/ws")).workspace_dir == home / "ws"
+    assert OpencodeConfig(workspace_dir=Path("/abs/ws")).workspace_dir == Path("/abs/ws")
+
+
+def test_env_max_tokens_error_names_legacy_variable(isolated_env: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OPENENCODE_MAX_TOKENS", "0")
+
+    with pytest.raises(ConfigError, match="^OPENENCODE_MAX_TOKENS must be a positive integer$"):
+        ConfigManager().load()
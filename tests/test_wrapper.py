@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from opencode_wrapper.config import OpencodeConfig
+from opencode_wrapper.wrapper import CommandSpec, OpencodeRunner
+
+
+class ExecCalled(Exception):
+    """Stands in for os.execvpe never returning."""
+
+
+@pytest.fixture
+def exec_calls(monkeypatch: pytest.MonkeyPatch) -> list[tuple[Any, ...]]:
+    calls: list[tuple[Any, ...]] = []
+
+    def fake_execvpe(*args: Any) -> None:
+        calls.append(args)
+        raise ExecCalled
+
+    monkeypatch.setattr(os, "execvpe", fake_execvpe)
+    return calls
+
+
+@pytest.fixture
+def run_calls(monkeypatch: pytest.MonkeyPatch) -> list[dict[str, Any]]:
+    calls: list[dict[str, Any]] = []
+
+    def fake_run(command: list[str], **kwargs: Any) -> subprocess.CompletedProcess[str]:
+        calls.append({"command": command, **kwargs})
+        return subprocess.CompletedProcess(command, 3)
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    return calls
+
+
+def test_build_env_exports_new_and_legacy_names() -> None:
+    config = OpencodeConfig(api_key="secret", model="m", max_tokens=10, workspace_dir="/tmp/ws")
+
+    env = OpencodeRunner()._build_env(config)
+
+    for prefix in ("OPENCODE_", "OPENENCODE_"):
+        assert env[f"{prefix}API_KEY"] == "secret"
+        assert env[f"{prefix}MODEL"] == "m"
+        assert env[f"{prefix}MAX_TOKENS"] == "10"
+        assert env[f"{prefix}WORKSPACE_DIR"] == "/tmp/ws"
+
+
+def test_build_env_reflects_model_copy_updates() -> None:
+    runner = OpencodeRunner()
+    config = OpencodeConfig(max_tokens=10)
+    assert runner._build_env(config)["OPENCODE_MAX_TOKENS"] == "10"
+
+    updated = config.model_copy(update={"max_tokens": 20})
+
+    assert runner._build_env(updated)["OPENCODE_MAX_TOKENS"] == "20"
+
+
+def test_interactive_run_execs_opencode_with_merged_env(
+    monkeypatch: pytest.MonkeyPatch, exec_calls: list[tuple[Any, ...]], run_calls: list[dict[str, Any]]
+) -> None:
+    monkeypatch.setenv("UNRELATED_VAR", "kept")
+
+    with pytest.raises(ExecCalled):
+        OpencodeRunner().run(OpencodeConfig(model="m"), ["--flag"], interactive=True)
+
+    [(executable, argv, env)] = exec_calls
+    assert (executable, argv) == ("opencode", ["opencode", "--flag"])
+    assert env["UNRELATED_VAR"] == "kept"
+    assert env["OPENCODE_MODEL"] == "m"
+    assert run_calls == []
+
+
+@pytest.mark.parametrize("exec_replace, use_working_dir", [(False, False), (True, True)])
+def test_interactive_run_falls_back_to_subprocess(
+    tmp_path: Path,
+    exec_calls: list[tuple[Any, ...]],
+    run_calls: list[dict[str, Any]],
+    exec_replace: bool,
+    use_working_dir: bool,
+) -> None:
+    working_dir = tmp_path if use_working_dir else None
+
+    result = OpencodeRunner().run(
+        OpencodeConfig(), ["x"], interactive=True, working_dir=working_dir, exec_replace=exec_replace
+    )
+
+    assert exec_calls == []
+    [call] = run_calls
+    assert call["command"] == ["opencode", "x"]
+    assert call["cwd"] == working_dir
+    assert call["env"]["OPENCODE_MODEL"] == "gpt-4"
+    assert (result.returncode, result.stdout, result.stderr) == (3, None, None)
+
+
+@pytest.mark.parametrize("interactive", [True, False])
+def test_missing_executable_raises_runtime_error(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, interactive: bool
+) -> None:
+    monkeypatch.setenv("PATH", str(tmp_path))
+    runner = OpencodeRunner(CommandSpec(executable="opencode-missing-for-test"))
+
+    with pytest.raises(RuntimeError, match="not found in PATH"):
+        runner.run(OpencodeConfig(), [], interactive=interactive)
+
+
+@pytest.fixture
+def fake_opencode(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "opencode"
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    return script
+
+
+def _write_script(script: Path, body: str) -> None:
+    script.write_text(f"#!/bin/sh\n{body}")
+    script.chmod(0o755)
+
+
+def test_stream_routes_output_and_propagates_returncode(
+    fake_opencode: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    _write_script(fake_opencode, 'echo "out $OPENCODE_MODEL $*"\necho err >&2\nexit 4\n')
+
+    result = OpencodeRunner().run(OpencodeConfig(model="m"), ["a", "b"], interactive=False)
+
+    captured = capsys.readouterr()
+    assert (captured.out, captured.err) == ("out m a b\n", "err\n")
+    assert (result.returncode, result.stdout, result.stderr) == (4, None, None)
+
+
+def test_stream_capture_collects_output(fake_opencode: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    _write_script(fake_opencode, "echo out\necho err >&2\n")
+
+    result = OpencodeRunner().run(OpencodeConfig(), [], interactive=False, capture=True)
+
+    assert (result.returncode, result.stdout, result.stderr) == (0, "out\n", "err\n")
+    assert capsys.readouterr().out == "out\n"
+
+
+def test_stream_decodes_utf8_split_across_reads(fake_opencode: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    # "é" is 0xC3 0xA9; the pause makes the two bytes arrive in separate reads.
+    _write_script(fake_opencode, "printf '\\303'\nsleep 0.2\nprintf '\\251\\n'\n")
+
+    result = OpencodeRunner().run(OpencodeConfig(), [], interactive=False, capture=True)
+
+    assert result.stdout == "é\n"
+    assert capsys.readouterr().out == "é\n"
+
+
+def test_stream_finishes_when_one_pipe_closes_early(fake_opencode: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    _write_script(fake_opencode, "exec 2>&-\nsleep 0.1\necho late\n")
+
+    result = OpencodeRunner().run(OpencodeConfig(), [], interactive=False, capture=True)
+
+    assert (result.returncode, result.stdout, result.stderr) == (0, "late\n", "")